@@ -4,15 +4,40 @@ Conference Deadline Alert Bot v6
 학회별로 그룹화, 모든 deadline을 하위 항목으로 표시
 """
 
+import asyncio
+import aiohttp
+import functools
+import orjson
+import re
 import requests
-import json
 import yaml
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from operator import itemgetter
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 import os
+import time
+
+# libyaml 기반 C 로더 사용 (없으면 순수 파이썬 로더로 폴백)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 SLACK_WEBHOOK_URL = os.environ.get('SLACK_WEBHOOK_URL')
 
+# 연결 재사용을 위한 공용 세션 (Slack 전송 등 동기 요청용)
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = 'conference-alarm-bot'
+_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=requests.adapters.Retry(
+        total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+    ),
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
 # ccfddl에서 가져올 학회 목록 (카테고리/파일명)
 CCFDDL_CONFERENCES = [
     # AI
@@ -64,6 +89,13 @@ TARGET_CONFERENCES = [
     "IEEE S&P",
 ]
 
+# 목표 학회명을 하나의 교대 정규식으로 컴파일 (긴 이름 우선 매칭)
+_TARGET_PATTERN = re.compile(
+    '|'.join(sorted((re.escape(t) for t in TARGET_CONFERENCES), key=len, reverse=True)),
+    re.IGNORECASE,
+)
+_TARGET_NAMES_UPPER = tuple(t.upper() for t in TARGET_CONFERENCES)
+
 # 타임존 매핑 (ccfddl 형식 -> IANA 형식)
 TIMEZONE_MAP = {
     "UTC-12": "Etc/GMT+12",  # AoE (Anywhere on Earth)
@@ -97,6 +129,63 @@ TIMEZONE_MAP = {
 
 KST = ZoneInfo("Asia/Seoul")
 
+# YAML 응답 본문 크기 상한 (비정상적으로 큰 응답 방어)
+_MAX_RESPONSE_BYTES = 1_000_000
+
+# 가져온 YAML 디스크 캐시 - TTL 내 재실행은 네트워크를 건너뜀
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+    'conference-alarm',
+)
+# 분야별 TTL (시간): 데드라인이 자주 갱신되는 AI는 짧게, 나머지는 길게
+CACHE_TTL_HOURS = {
+    "AI": 6,
+}
+CACHE_TTL_DEFAULT_HOURS = 12
+
+
+def _cache_path(sub, name):
+    return os.path.join(CACHE_DIR, f"{sub}_{name}.yml")
+
+
+def _read_cache(path, max_age=None):
+    """캐시 파일 내용 읽기 (max_age 지정 시 TTL 초과분은 None)"""
+    try:
+        if max_age is not None and time.time() - os.path.getmtime(path) >= max_age:
+            return None
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _read_etag(path):
+    try:
+        with open(path + '.etag', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_cache(path, text, etag=None):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        if etag:
+            with open(path + '.etag', 'w', encoding='utf-8') as f:
+                f.write(etag)
+    except OSError:
+        pass
+
+
+def _touch_cache(path):
+    """304 응답 시 캐시 mtime을 갱신해서 TTL을 연장"""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
 
 def convert_to_kst(deadline, timezone_str):
     """deadline을 해당 타임존에서 KST로 변환"""
@@ -105,7 +194,7 @@ def convert_to_kst(deadline, timezone_str):
     
     try:
         tz = ZoneInfo(tz_str)
-    except:
+    except ZoneInfoNotFoundError:
         tz = ZoneInfo("Etc/GMT+12")
     
     # deadline에 타임존 부여
@@ -117,100 +206,211 @@ def convert_to_kst(deadline, timezone_str):
     return deadline_kst
 
 
-def fetch_ccfddl_conference(sub, name):
-    """ccfddl GitHub에서 개별 학회 YAML 가져오기"""
+async def fetch_ccfddl_conference(session, sub, name):
+    """ccfddl GitHub에서 개별 학회 YAML 가져오기 (TTL 디스크 캐시 사용)"""
     url = f"https://raw.githubusercontent.com/ccfddl/ccf-deadlines/main/conference/{sub}/{name}.yml"
-    
+
+    cache_path = _cache_path(sub, name)
+    max_age = CACHE_TTL_HOURS.get(sub, CACHE_TTL_DEFAULT_HOURS) * 3600
+    cached = _read_cache(cache_path, max_age)
+    if cached is not None:
+        try:
+            return await asyncio.to_thread(yaml.load, cached, Loader=_YamlLoader)
+        except yaml.YAMLError:
+            pass  # 캐시가 손상된 경우 새로 받아옴
+
+    # TTL이 지난 캐시는 ETag로 조건부 재검증 (변경 없으면 304로 본문 생략)
+    headers = {}
+    etag = _read_etag(cache_path)
+    if etag:
+        headers['If-None-Match'] = etag
+
+    # 네트워크 오류만 여기서 처리 - 파싱은 try 밖에서 수행
     try:
-        response = requests.get(url, timeout=15)
-        if response.status_code == 200:
-            return yaml.safe_load(response.text)
-    except Exception as e:
+        async with session.get(
+            url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)
+        ) as response:
+            if response.status == 304:
+                stale = _read_cache(cache_path)
+                if stale is not None:
+                    _touch_cache(cache_path)
+                    try:
+                        return await asyncio.to_thread(
+                            yaml.load, stale, Loader=_YamlLoader
+                        )
+                    except yaml.YAMLError:
+                        return None
+                return None
+            if response.status != 200:
+                return None
+            # 본문을 상한 크기까지만 스트리밍으로 읽음
+            raw = await response.content.read(_MAX_RESPONSE_BYTES)
+            text = raw.decode(response.get_encoding(), errors='replace')
+            new_etag = response.headers.get('ETag')
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"[ccfddl] Error fetching {sub}/{name}: {e}")
-    
-    return None
+        return None
+
+    _write_cache(cache_path, text, new_etag)
+    try:
+        # YAML 파싱은 스레드로 넘겨서 이벤트 루프를 막지 않음
+        return await asyncio.to_thread(yaml.load, text, Loader=_YamlLoader)
+    except yaml.YAMLError as e:
+        print(f"[ccfddl] Error parsing {sub}/{name}: {e}")
+        return None
+
+
+async def fetch_all_ccfddl_conferences():
+    """모든 학회 YAML을 동시에 가져오기 (동시 요청 수 제한)"""
+    # raw.githubusercontent.com 배려를 위해 동시 요청을 10개로 제한
+    semaphore = asyncio.Semaphore(10)
+
+    async def fetch_limited(session, sub, name):
+        async with semaphore:
+            return await fetch_ccfddl_conference(session, sub, name)
+
+    connector = aiohttp.TCPConnector(limit=20, keepalive_timeout=10)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        tasks = [
+            fetch_limited(session, sub, name)
+            for sub, name in CCFDDL_CONFERENCES
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    # 예기치 못한 예외는 해당 학회만 건너뛰고 나머지는 계속 처리
+    cleaned = []
+    for (sub, name), result in zip(CCFDDL_CONFERENCES, results):
+        if isinstance(result, BaseException):
+            print(f"[ccfddl] Unexpected error for {sub}/{name}: {result}")
+            cleaned.append(None)
+        else:
+            cleaned.append(result)
+    return cleaned
+
+
+# 미정 표기(TBD/TBA/N/A) 검사와 따옴표 제거는 C 수준 한 번의 패스로 처리
+_BAD_DEADLINE = re.compile(r'TB[DA]|N/A', re.IGNORECASE).search
+_QUOTE_TABLE = {ord("'"): None, ord('"'): None}
+
+# 형식별 정규식으로 먼저 선별해서 strptime 시도 횟수를 줄임
+_DEADLINE_FORMATS = (
+    (re.compile(r'^\d{4}-\d{2}-\d{2} \d{1,2}:\d{2}:\d{2}$'), "%Y-%m-%d %H:%M:%S"),
+    (re.compile(r'^\d{4}-\d{2}-\d{2} \d{1,2}:\d{2}$'), "%Y-%m-%d %H:%M"),
+    (re.compile(r'^\d{4}-\d{2}-\d{2}$'), "%Y-%m-%d"),
+)
 
 
+@functools.lru_cache(maxsize=2048)
 def parse_deadline(deadline_str):
-    """데드라인 문자열 파싱"""
+    """데드라인 문자열 파싱 (같은 문자열은 캐시에서 재사용)"""
     if not deadline_str:
         return None
-    
-    clean_str = str(deadline_str).strip().replace("'", "").replace('"', '')
-    
-    if any(x in clean_str.upper() for x in ["TBD", "TBA", "N/A"]):
+
+    clean_str = str(deadline_str).strip().translate(_QUOTE_TABLE)
+
+    if _BAD_DEADLINE(clean_str):
         return None
-    
-    formats = [
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d %H:%M",
-        "%Y-%m-%d",
-    ]
-    
-    for fmt in formats:
+
+    # C로 구현된 ISO 파서를 먼저 시도 (대부분의 입력이 ISO 형식)
+    # 지원하는 세 형식의 길이(10/16/19)일 때만 시도해서 예외 비용을 피함
+    if len(clean_str) in (10, 16, 19):
+        try:
+            return datetime.fromisoformat(clean_str)
+        except ValueError:
+            pass
+
+    # 정규식이 맞는 형식 하나만 strptime 시도
+    for pattern, fmt in _DEADLINE_FORMATS:
+        if pattern.match(clean_str):
+            try:
+                return datetime.strptime(clean_str, fmt)
+            except ValueError:
+                break
+
+    # 선별 실패 시에만 전체 형식 순회 (기존 동작 유지)
+    for _, fmt in _DEADLINE_FORMATS:
         try:
             return datetime.strptime(clean_str, fmt)
         except ValueError:
             continue
-    
+
     return None
 
 
-def collect_conferences():
-    """ccfddl에서 학회 정보 수집 - 학회별로 그룹화"""
-    conferences = []
-    
-    for sub, name in CCFDDL_CONFERENCES:
-        data = fetch_ccfddl_conference(sub, name)
+async def collect_conferences(now=None):
+    """ccfddl에서 학회 정보 수집 - 학회별로 그룹화, (이름, 연도) 기준 중복 제거"""
+    if now is None:
+        now = datetime.now(KST)
+    current_year = now.year
+    max_year = current_year + 2  # 다음 연도 데드라인이 그 다음 해에 잡히는 경우까지
+
+    collected = {}
+    results = await fetch_all_ccfddl_conferences()
+
+    for (sub, name), data in zip(CCFDDL_CONFERENCES, results):
         if not data:
             continue
-        
+
+        # (sub, name) 단위 불변값은 루프 밖에서 한 번만 계산
+        category = CATEGORY_MAP.get(sub, sub)
+
         for conf in data:
             title = conf.get('title', '')
+            title_lower = title.lower()
             description = conf.get('description', '')
             rank = conf.get('rank', {}).get('ccf', '')
-            
+
             for cycle in conf.get('confs', []):
                 year = cycle.get('year', '')
+
+                # 지난/먼 연도 cycle은 timeline 파싱 전에 걸러냄
+                try:
+                    year_int = int(year)
+                except (TypeError, ValueError):
+                    year_int = None
+                if year_int is not None and not (current_year <= year_int <= max_year):
+                    continue
+
+                # 같은 학회/연도가 여러 YAML에 등장해도 먼저 수집된 항목 유지
+                # (중복이면 timeline 파싱 자체를 건너뜀)
+                key = (title_lower, year)
+                if key in collected:
+                    continue
+
                 link = cycle.get('link', '')
                 place = cycle.get('place', 'TBA')
                 date = cycle.get('date', 'TBA')
                 timezone = cycle.get('timezone', 'UTC-12')
                 
-                # 모든 timeline을 하나의 리스트로
+                # 모든 timeline을 하나의 리스트로 (같은 유형/시각은 한 번만)
                 timelines = []
+                seen_deadlines = set()
                 for t in cycle.get('timeline', []):
                     comment = t.get('comment', '')
-                    
-                    # Abstract deadline
-                    abstract_str = t.get('abstract_deadline')
-                    abstract_date = parse_deadline(abstract_str)
-                    if abstract_date:
-                        abstract_kst = convert_to_kst(abstract_date, timezone)
-                        timelines.append({
-                            'type': 'Abstract Registration',
-                            'deadline': abstract_date,
-                            'deadline_kst': abstract_kst,
-                            'comment': comment
-                        })
-                    
-                    # Paper deadline
-                    paper_str = t.get('deadline')
-                    paper_date = parse_deadline(paper_str)
-                    if paper_date:
-                        paper_kst = convert_to_kst(paper_date, timezone)
+
+                    for dtype, field in (
+                        ('Abstract Registration', 'abstract_deadline'),
+                        ('Paper Submission', 'deadline'),
+                    ):
+                        deadline = parse_deadline(t.get(field))
+                        if not deadline:
+                            continue
+                        dedup_key = (dtype, deadline)
+                        if dedup_key in seen_deadlines:
+                            continue
+                        seen_deadlines.add(dedup_key)
                         timelines.append({
-                            'type': 'Paper Submission',
-                            'deadline': paper_date,
-                            'deadline_kst': paper_kst,
+                            'type': dtype,
+                            'deadline': deadline,
+                            'deadline_kst': convert_to_kst(deadline, timezone),
                             'comment': comment
                         })
                 
                 if timelines:
-                    conferences.append({
+                    collected[key] = {
                         'name': title,
                         'full_name': description,
-                        'category': CATEGORY_MAP.get(sub, sub),
+                        'category': category,
                         'ccf_rank': rank,
                         'year': year,
                         'place': place,
@@ -219,16 +419,17 @@ def collect_conferences():
                         'link': link,
                         'timelines': timelines,
                         'source': 'ccfddl'
-                    })
-        
+                    }
+
         print(f"[ccfddl] Fetched {sub}/{name}")
-    
-    return conferences
 
+    return list(collected.values())
 
-def get_upcoming_conferences(conferences):
+
+def get_upcoming_conferences(conferences, now_kst=None):
     """현재 연도 + 다음 연도까지의 학회 필터링"""
-    now_kst = datetime.now(KST)
+    if now_kst is None:
+        now_kst = datetime.now(KST)
     current_year = now_kst.year
     next_year = current_year + 1
     upcoming = []
@@ -236,47 +437,50 @@ def get_upcoming_conferences(conferences):
     for conf in conferences:
         # 각 timeline의 days_left 계산 (KST 기준)
         future_timelines = []
-        min_days_left = float('inf')
-        
+
         for t in conf['timelines']:
             deadline_kst = t['deadline_kst']
             days_left = (deadline_kst - now_kst).days
-            
+
             # 미래 deadline만 포함, 현재/다음 연도만
             if days_left >= 0 and deadline_kst.year <= next_year:
                 t['days_left'] = days_left
                 future_timelines.append(t)
-                min_days_left = min(min_days_left, days_left)
-        
+
         if future_timelines:
-            conf['timelines'] = sorted(future_timelines, key=lambda x: x['deadline_kst'])
-            conf['min_days_left'] = min_days_left
+            future_timelines.sort(key=itemgetter('deadline_kst'))
+            conf['timelines'] = future_timelines
+            conf['min_days_left'] = future_timelines[0]['days_left']
             upcoming.append(conf)
     
     # 가장 빠른 deadline 기준 정렬
-    upcoming.sort(key=lambda x: x['min_days_left'])
+    upcoming.sort(key=itemgetter('min_days_left'))
     return upcoming
 
 
 def filter_target_conferences(conferences):
     """목표 학회만 필터링"""
-    target_names = [t.upper() for t in TARGET_CONFERENCES]
     filtered = []
 
     for conf in conferences:
-        conf_name = conf['name'].upper()
-        # 학회명이 목표 학회 목록에 포함되는지 확인
-        for target in target_names:
-            if target in conf_name or conf_name in target:
-                filtered.append(conf)
-                break
+        conf_name = conf['name']
+        # 목표 학회명이 학회명에 포함되는지 한 번의 정규식 검색으로 확인
+        if _TARGET_PATTERN.search(conf_name):
+            filtered.append(conf)
+            continue
+        # 학회명이 목표 이름의 일부인 경우 (예: 약칭만 있는 항목)
+        conf_upper = conf_name.upper()
+        if any(conf_upper in t for t in _TARGET_NAMES_UPPER):
+            filtered.append(conf)
 
     return filtered
 
 
-def format_slack_message_by_category(conferences):
+def format_slack_message_by_category(conferences, now=None):
     """Slack 메시지 포맷팅 - 분야별 그룹화 (홀수일용)"""
-    current_year = datetime.now().year
+    if now is None:
+        now = datetime.now(KST)
+    current_year = now.year
 
     if not conferences:
         return {
@@ -344,7 +548,7 @@ def format_slack_message_by_category(conferences):
         if cat not in by_category:
             continue
 
-        conf_list = sorted(by_category[cat], key=lambda x: x['min_days_left'])
+        conf_list = sorted(by_category[cat], key=itemgetter('min_days_left'))
 
         blocks.append({
             "type": "section",
@@ -354,11 +558,9 @@ def format_slack_message_by_category(conferences):
             }
         })
 
-        for conf in conf_list:
-            blocks.append({
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": format_conference(conf)}
-            })
+        blocks.extend(_chunked_section_blocks(
+            [format_conference(conf) for conf in conf_list]
+        ))
 
         blocks.append({"type": "divider"})
 
@@ -367,7 +569,7 @@ def format_slack_message_by_category(conferences):
         "elements": [
             {
                 "type": "mrkdwn",
-                "text": f"Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')} KST | Source: ccfddl"
+                "text": f"Updated: {now.strftime('%Y-%m-%d %H:%M')} KST | Source: ccfddl"
             }
         ]
     })
@@ -375,19 +577,22 @@ def format_slack_message_by_category(conferences):
     return {"blocks": blocks}
 
 
-def format_slack_message_target(conferences):
+def format_slack_message_target(conferences, now=None):
     """Slack 메시지 포맷팅 - 목표 학회용 (짝수일용)"""
-    current_year = datetime.now().year
+    if now is None:
+        now = datetime.now(KST)
+    current_year = now.year
 
     if not conferences:
         return {
             "text": f"🎯 *Target Conference Alert*\n\n{current_year}-{current_year+1} 목표 학회 데드라인이 없습니다."
         }
 
-    # 기간별 분류
-    urgent = [c for c in conferences if c['min_days_left'] <= 30]
-    upcoming = [c for c in conferences if 30 < c['min_days_left'] <= 180]
-    later = [c for c in conferences if c['min_days_left'] > 180]
+    # 기간별 분류 - 한 번의 순회로 세 버킷에 분배
+    urgent, upcoming, later = [], [], []
+    for c in conferences:
+        d = c['min_days_left']
+        (urgent if d <= 30 else upcoming if d <= 180 else later).append(c)
 
     blocks = [
         {
@@ -458,11 +663,9 @@ def format_slack_message_target(conferences):
             }
         })
 
-        for conf in conf_list:
-            blocks.append({
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": format_conference(conf)}
-            })
+        blocks.extend(_chunked_section_blocks(
+            [format_conference(conf) for conf in conf_list]
+        ))
 
         blocks.append({"type": "divider"})
 
@@ -475,7 +678,7 @@ def format_slack_message_target(conferences):
         "elements": [
             {
                 "type": "mrkdwn",
-                "text": f"Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')} KST | Source: ccfddl"
+                "text": f"Updated: {now.strftime('%Y-%m-%d %H:%M')} KST | Source: ccfddl"
             }
         ]
     })
@@ -483,19 +686,22 @@ def format_slack_message_target(conferences):
     return {"blocks": blocks}
 
 
-def format_slack_message(conferences):
+def format_slack_message(conferences, now=None):
     """Slack 메시지 포맷팅 - 학회별 그룹화, 기간별 분류"""
-    current_year = datetime.now().year
+    if now is None:
+        now = datetime.now(KST)
+    current_year = now.year
     
     if not conferences:
         return {
             "text": f"📅 *Conference Deadline Alert*\n\n{current_year}-{current_year+1} 예정된 학회 데드라인이 없습니다."
         }
     
-    # 기간별 분류
-    urgent = [c for c in conferences if c['min_days_left'] <= 30]
-    upcoming = [c for c in conferences if 30 < c['min_days_left'] <= 180]
-    later = [c for c in conferences if c['min_days_left'] > 180]
+    # 기간별 분류 - 한 번의 순회로 세 버킷에 분배
+    urgent, upcoming, later = [], [], []
+    for c in conferences:
+        d = c['min_days_left']
+        (urgent if d <= 30 else upcoming if d <= 180 else later).append(c)
     
     blocks = [
         {
@@ -571,11 +777,9 @@ def format_slack_message(conferences):
             }
         })
         
-        for conf in conf_list:
-            blocks.append({
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": format_conference(conf)}
-            })
+        blocks.extend(_chunked_section_blocks(
+            [format_conference(conf) for conf in conf_list]
+        ))
         
         blocks.append({"type": "divider"})
     
@@ -588,7 +792,7 @@ def format_slack_message(conferences):
         "elements": [
             {
                 "type": "mrkdwn",
-                "text": f"Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')} KST | Source: ccfddl"
+                "text": f"Updated: {now.strftime('%Y-%m-%d %H:%M')} KST | Source: ccfddl"
             }
         ]
     })
@@ -596,34 +800,82 @@ def format_slack_message(conferences):
     return {"blocks": blocks}
 
 
+# Slack은 메시지당 block 50개까지만 허용 - 분할 시 약간의 여유를 둠
+_MAX_BLOCKS_PER_MESSAGE = 48
+
+# mrkdwn section 블록당 글자 수 제한(3000)에 대한 여유치
+_MAX_SECTION_CHARS = 2900
+
+
+def _chunked_section_blocks(texts):
+    """항목 텍스트들을 글자 수 제한에 맞춰 합친 section 블록 리스트 생성"""
+    blocks = []
+    current = []
+    length = 0
+
+    for text in texts:
+        if current and length + len(text) + 2 > _MAX_SECTION_CHARS:
+            blocks.append({
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": "\n\n".join(current)}
+            })
+            current, length = [], 0
+        current.append(text)
+        length += len(text) + 2  # 항목 사이 빈 줄 포함
+
+    if current:
+        blocks.append({
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": "\n\n".join(current)}
+        })
+
+    return blocks
+
+
 def send_slack_notification(message):
-    """Slack으로 메시지 전송"""
+    """Slack으로 메시지 전송 (block 수 제한 초과 시 분할 전송)"""
     if not SLACK_WEBHOOK_URL:
         print("SLACK_WEBHOOK_URL not set")
         return False
-    
-    try:
-        response = requests.post(
-            SLACK_WEBHOOK_URL,
-            json=message,
-            headers={'Content-Type': 'application/json'}
-        )
-        if response.status_code != 200:
-            print(f"Slack error: {response.status_code} - {response.text}")
-        return response.status_code == 200
-    except Exception as e:
-        print(f"Error sending Slack notification: {e}")
-        return False
 
+    blocks = message.get('blocks')
+    if blocks and len(blocks) > _MAX_BLOCKS_PER_MESSAGE:
+        payloads = [
+            {"blocks": blocks[i:i + _MAX_BLOCKS_PER_MESSAGE]}
+            for i in range(0, len(blocks), _MAX_BLOCKS_PER_MESSAGE)
+        ]
+    else:
+        payloads = [message]
+
+    success = True
+    for payload in payloads:
+        try:
+            response = SESSION.post(
+                SLACK_WEBHOOK_URL,
+                data=orjson.dumps(payload),
+                headers={'Content-Type': 'application/json'}
+            )
+            if response.status_code != 200:
+                print(f"Slack error: {response.status_code} - {response.text}")
+                success = False
+        except Exception as e:
+            print(f"Error sending Slack notification: {e}")
+            success = False
+
+    return success
+
+
+async def main():
+    # 실행 기준 시각을 한 번만 계산 (KST) - 전체 실행에서 동일한 '지금'을 사용
+    now = datetime.now(KST)
 
-def main():
     print("="*60)
     print("Conference Deadline Alert Bot v7")
-    print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
     print("="*60)
 
     # 오늘 날짜 확인 (홀수일/짝수일)
-    today = datetime.now(KST)
+    today = now
     is_odd_day = today.day % 2 == 1
 
     if is_odd_day:
@@ -632,12 +884,12 @@ def main():
         print(f"🎯 오늘은 {today.day}일 (짝수일) - 목표 학회 알림")
 
     # 학회 정보 수집
-    conferences = collect_conferences()
+    conferences = await collect_conferences(now)
     print(f"\nTotal collected: {len(conferences)} conference cycles")
 
     # 필터링
-    upcoming = get_upcoming_conferences(conferences)
-    current_year = datetime.now().year
+    upcoming = get_upcoming_conferences(conferences, now)
+    current_year = now.year
     print(f"Upcoming ({current_year}-{current_year+1}): {len(upcoming)} conferences")
 
     # 홀수일/짝수일에 따라 다른 처리
@@ -661,16 +913,16 @@ def main():
 
     # Slack 메시지 생성 및 전송
     if is_odd_day:
-        message = format_slack_message_by_category(display_conferences)
+        message = format_slack_message_by_category(display_conferences, now)
     else:
-        message = format_slack_message_target(display_conferences)
+        message = format_slack_message_target(display_conferences, now)
 
     if send_slack_notification(message):
         print("\n✅ Slack notification sent successfully!")
     else:
         print("\n❌ Failed to send Slack notification")
-        print(json.dumps(message, indent=2, ensure_ascii=False, default=str))
+        print(orjson.dumps(message, option=orjson.OPT_INDENT_2).decode())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file